@@ -11,12 +11,20 @@ from monitor import make_icon
 from PIL import Image
 
 SIZES = [16, 32, 48, 64, 128, 256]
+MASTER = max(SIZES)
 
-images = []
-for size in SIZES:
-    img = make_icon(75)                            # green battery ~75%
-    img = img.resize((size, size), Image.LANCZOS)
-    images.append(img)
+
+def downsample(img: Image.Image, size: int) -> Image.Image:
+    """Shrink *img* to *size*; BOX is exact and cheaper for integer ratios."""
+    if img.width == size:
+        return img
+    resample = Image.BOX if img.width % size == 0 else Image.LANCZOS
+    return img.resize((size, size), resample)
+
+
+# Render once at the largest size and only ever downsample from it.
+master = make_icon(75, MASTER)                     # green battery ~75%
+images = [downsample(master, size) for size in SIZES]
 
 out = Path(__file__).parent / "icon.ico"
 images[0].save(
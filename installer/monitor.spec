@@ -24,6 +24,12 @@ a = Analysis(
             "bleak.backends.winrt.scanner",
             "bleak.backends.winrt.utils",
             "pystray._win32",
+            "winrt.system",
+            "winrt.windows.data.xml.dom",
+            "winrt.windows.devices.enumeration",
+            "winrt.windows.foundation",
+            "winrt.windows.foundation.collections",
+            "winrt.windows.ui.notifications",
             "PIL._imaging",
             "winreg",
         ]
@@ -7,7 +7,8 @@ from __future__ import annotations
 import asyncio
 import ctypes
 import ctypes.wintypes
-import json
+import functools
+import locale
 import logging
 import os
 import re
@@ -16,16 +17,58 @@ import sys
 import threading
 import winreg
 from pathlib import Path
+from xml.sax.saxutils import escape
 
-import pystray
-from bleak import BleakClient, BleakScanner
-from PIL import Image, ImageDraw, ImageFont
+# ---------------------------------------------------------------------------
+# Single-instance guard
+# ---------------------------------------------------------------------------
+_MUTEX_HANDLE = None   # keep reference so the handle stays open
+
+
+def _acquire_single_instance() -> bool:
+    """Create a named Windows mutex.  Returns False if another instance owns it."""
+    global _MUTEX_HANDLE
+    ERROR_ALREADY_EXISTS = 183
+    handle = ctypes.windll.kernel32.CreateMutexW(None, True, "LogitechBatteryMonitor_SingleInstance")
+    if ctypes.windll.kernel32.GetLastError() == ERROR_ALREADY_EXISTS:
+        if handle:
+            ctypes.windll.kernel32.CloseHandle(handle)
+        return False
+    _MUTEX_HANDLE = handle   # keep alive for the lifetime of the process
+    return True
+
+
+# Checked before the third-party imports and logging setup below, so a second
+# launch exits without loading bleak/pystray/PIL or opening the log file.
+if __name__ == "__main__" and not _acquire_single_instance():
+    # Another instance is already running — bail out silently.
+    sys.exit(0)
+
+import orjson  # noqa: E402
+import pystray  # noqa: E402
+from bleak import BleakClient, BleakScanner  # noqa: E402
+from bleak.backends.characteristic import BleakGATTCharacteristic  # noqa: E402
+from bleak.backends.device import BLEDevice  # noqa: E402
+from PIL import Image, ImageDraw, ImageFont  # noqa: E402
+
+try:
+    from winrt.windows.data.xml.dom import XmlDocument
+    from winrt.windows.ui.notifications import ToastNotification, ToastNotificationManager
+except ImportError:     # WinRT projections missing — fall back to PowerShell balloons
+    ToastNotificationManager = None
+
+try:
+    from winrt.system import unbox_int32, unbox_uint8, unbox_uint32
+    from winrt.windows.devices.enumeration import DeviceInformation
+except ImportError:     # WinRT projections missing — fall back to PowerShell only
+    DeviceInformation = None
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 APP_VERSION    = "1.0.3"
 CHECK_INTERVAL = 5 * 60          # seconds between automatic refreshes
+ICON_STEP      = 5               # tray icon granularity in percent
 ALERT_LEVELS   = [20, 10, 5]     # thresholds for toast notifications (desc order)
 BLE_SCAN_TIMEOUT  = 15.0         # seconds for BLE device discovery
 BLE_CONN_TIMEOUT  = 15.0         # seconds for BLE connection
@@ -41,6 +84,9 @@ LOG_FILE    = CONFIG_DIR / "monitor.log"
 REGISTRY_RUN_KEY = r"Software\Microsoft\Windows\CurrentVersion\Run"
 REGISTRY_VALUE   = "LogitechBatteryMonitor"
 
+APP_ID     = "LogitechBatteryMonitor"     # AppUserModelID used for toasts
+APP_ID_KEY = rf"Software\Classes\AppUserModelId\{APP_ID}"
+
 APP_NAME = "Logitech Battery Monitor"
 
 # ---------------------------------------------------------------------------
@@ -61,60 +107,89 @@ log = logging.getLogger(__name__)
 # ---------------------------------------------------------------------------
 # Icon generation
 # ---------------------------------------------------------------------------
-def make_icon(battery: int | None) -> Image.Image:
-    """Return a 64×64 RGBA PIL image representing the battery level."""
-    W, H = 64, 64
-    img  = Image.new("RGBA", (W, H), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
+ICON_GRID = 64                   # icon geometry is laid out on a 64×64 grid
 
-    # Colour coding
+
+@functools.lru_cache(maxsize=None)
+def _load_font(px: int) -> ImageFont.ImageFont:
+    try:
+        return ImageFont.truetype("arialbd.ttf", px)
+    except Exception:
+        return ImageFont.load_default()
+
+
+def _px(v: int, size: int) -> int:
+    """Scale *v* from the 64-unit icon grid to a *size* pixel icon."""
+    return round(v * size / ICON_GRID)
+
+
+def _icon_colours(battery: int | None) -> tuple[tuple[int, ...], tuple[int, ...]]:
+    """Return (body_colour, fill_colour) for *battery*."""
     if battery is None:
-        body_colour  = (160, 160, 160, 255)   # grey
-        fill_colour  = (120, 120, 120, 255)
-    elif battery > 30:
-        body_colour  = (60, 179, 113, 255)    # green
-        fill_colour  = (34, 139, 34, 255)
-    elif battery > 20:
-        body_colour  = (255, 215, 0, 255)     # yellow
-        fill_colour  = (218, 165, 32, 255)
-    elif battery > 10:
-        body_colour  = (255, 140, 0, 255)     # orange
-        fill_colour  = (210, 105, 30, 255)
-    else:
-        body_colour  = (220, 50, 47, 255)     # red
-        fill_colour  = (178, 34, 34, 255)
-
-    # Battery body dimensions
-    margin   = 4
-    nub_w    = 6
-    nub_h    = 16
-    body_x0  = margin
-    body_y0  = (H - 36) // 2
-    body_x1  = W - margin - nub_w - 2
-    body_y1  = body_y0 + 36
+        return (160, 160, 160, 255), (120, 120, 120, 255)   # grey
+    if battery > 30:
+        return (60, 179, 113, 255), (34, 139, 34, 255)      # green
+    if battery > 20:
+        return (255, 215, 0, 255), (218, 165, 32, 255)      # yellow
+    if battery > 10:
+        return (255, 140, 0, 255), (210, 105, 30, 255)      # orange
+    return (220, 50, 47, 255), (178, 34, 34, 255)           # red
+
+
+def _body_box(size: int) -> tuple[int, int, int, int]:
+    """Return the battery body rectangle (x0, y0, x1, y1) for *size*."""
+    margin  = _px(4, size)
+    nub_w   = _px(6, size)
+    nub_gap = _px(2, size)
+    body_h  = _px(36, size)
+    body_y0 = (size - body_h) // 2
+    return margin, body_y0, size - margin - nub_w - nub_gap, body_y0 + body_h
+
+
+def _outline_width(size: int) -> int:
+    return max(1, _px(3, size))
+
+
+@functools.lru_cache(maxsize=None)
+def _chrome(body_colour: tuple[int, ...], size: int) -> Image.Image:
+    """Render the battery outline and terminal nub, which only vary by colour."""
+    img  = Image.new("RGBA", (size, size), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(img)
+    body_x0, body_y0, body_x1, body_y1 = _body_box(size)
 
     # Outline
-    outline_w = 3
     draw.rounded_rectangle(
         [body_x0, body_y0, body_x1, body_y1],
-        radius=4,
+        radius=_px(4, size),
         outline=body_colour,
-        width=outline_w,
+        width=_outline_width(size),
     )
 
     # Terminal nub
-    nub_x0 = body_x1 + 2
+    nub_w  = _px(6, size)
+    nub_h  = _px(16, size)
+    nub_x0 = body_x1 + _px(2, size)
     nub_x1 = nub_x0 + nub_w
     nub_y0 = body_y0 + (body_y1 - body_y0 - nub_h) // 2
     nub_y1 = nub_y0 + nub_h
     draw.rounded_rectangle(
         [nub_x0, nub_y0, nub_x1, nub_y1],
-        radius=2,
+        radius=_px(2, size),
         fill=body_colour,
     )
 
+    return img
+
+
+def make_icon(battery: int | None, size: int = ICON_GRID) -> Image.Image:
+    """Return a *size*×*size* RGBA PIL image representing the battery level."""
+    body_colour, fill_colour = _icon_colours(battery)
+    img  = _chrome(body_colour, size).copy()
+    draw = ImageDraw.Draw(img)
+    body_x0, body_y0, body_x1, body_y1 = _body_box(size)
+
     # Fill bar (inside body)
-    inner_margin = outline_w + 2
+    inner_margin = _outline_width(size) + _px(2, size)
     inner_x0 = body_x0 + inner_margin
     inner_y0 = body_y0 + inner_margin
     inner_x1 = body_x1 - inner_margin
@@ -122,21 +197,17 @@ def make_icon(battery: int | None) -> Image.Image:
     inner_w  = inner_x1 - inner_x0
 
     if battery is not None and battery > 0:
-        fill_w = max(2, int(inner_w * battery / 100))
+        fill_w = max(_px(2, size), int(inner_w * battery / 100))
         draw.rounded_rectangle(
             [inner_x0, inner_y0, inner_x0 + fill_w, inner_y1],
-            radius=2,
+            radius=_px(2, size),
             fill=fill_colour,
         )
 
     # Percentage text
     label = "?" if battery is None else f"{battery}%"
-    try:
-        font = ImageFont.truetype("arialbd.ttf", 14)
-    except Exception:
-        font = ImageFont.load_default()
-
-    bbox = draw.textbbox((0, 0), label, font=font)
+    font  = _load_font(_px(14, size))
+    bbox  = draw.textbbox((0, 0), label, font=font)
     tw, th = bbox[2] - bbox[0], bbox[3] - bbox[1]
     cx = (body_x0 + body_x1) // 2
     cy = (body_y0 + body_y1) // 2
@@ -150,11 +221,78 @@ def make_icon(battery: int | None) -> Image.Image:
     return img
 
 
+# Tray icons for every bucket _update_icon can ask for, rendered once up front
+# so a refresh is a dict lookup.  pystray only reads the pixels, so the
+# shared images are never mutated.
+_ICON_CACHE: dict[int | None, Image.Image] = {}
+
+
+def _prerender_icons() -> None:
+    for bucket in [None, *range(0, 101, ICON_STEP)]:
+        _ICON_CACHE[bucket] = make_icon(bucket)
+
+
 # ---------------------------------------------------------------------------
 # Notifications
 # ---------------------------------------------------------------------------
+_TOAST_XML = """
+<toast{scenario}>
+  <visual>
+    <binding template="ToastGeneric">
+      <text>{title}</text>
+      <text>{body}</text>
+    </binding>
+  </visual>
+  {audio}
+</toast>
+"""
+
+# level -> (toast scenario attribute, audio element)
+_TOAST_LEVELS = {
+    "info":    ("", '<audio silent="true"/>'),
+    "warning": ("", ""),
+    "error":   (' scenario="urgent"', '<audio src="ms-winsoundevent:Notification.Reminder"/>'),
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _toast_notifier():
+    """Register our AppUserModelID once and return a reusable toast notifier.
+
+    The MSI owns this registry key (and removes it on uninstall); writing
+    it here covers running from source.
+    """
+    if not getattr(sys, "frozen", False):
+        key = winreg.CreateKey(winreg.HKEY_CURRENT_USER, APP_ID_KEY)
+        winreg.SetValueEx(key, "DisplayName", 0, winreg.REG_SZ, APP_NAME)
+        winreg.CloseKey(key)
+    return ToastNotificationManager.create_toast_notifier(APP_ID)
+
+
 def send_notification(title: str, body: str, level: str = "warning") -> None:
-    """Fire a Windows toast notification via PowerShell (no console window)."""
+    """Fire a Windows toast notification in-process via WinRT.
+
+    *level* ("info", "warning" or "error") picks the toast sound, and
+    "error" toasts use the urgent scenario where Windows supports it.
+    Falls back to a PowerShell balloon tip (where *level* picks the icon)
+    if the WinRT projections are unavailable or the toast fails.
+    """
+    if ToastNotificationManager is not None:
+        try:
+            scenario, audio = _TOAST_LEVELS.get(level, _TOAST_LEVELS["warning"])
+            doc = XmlDocument()
+            doc.load_xml(_TOAST_XML.format(
+                title=escape(title), body=escape(body), scenario=scenario, audio=audio,
+            ))
+            _toast_notifier().show(ToastNotification(doc))
+            return
+        except Exception as exc:
+            log.warning("Toast notification failed: %s", exc)
+    _send_balloon(title, body, level)
+
+
+def _send_balloon(title: str, body: str, level: str) -> None:
+    """Show a balloon tip via PowerShell (no console window)."""
     icon_map = {
         "info":    "SystemIcons.Information",
         "warning": "SystemIcons.Warning",
@@ -185,14 +323,14 @@ $ni.Dispose()
 # ---------------------------------------------------------------------------
 def load_config() -> dict:
     try:
-        return json.loads(CONFIG_FILE.read_text(encoding="utf-8"))
+        return orjson.loads(CONFIG_FILE.read_bytes())
     except Exception:
         return {}
 
 
 def save_config(cfg: dict) -> None:
     try:
-        CONFIG_FILE.write_text(json.dumps(cfg, indent=2), encoding="utf-8")
+        CONFIG_FILE.write_bytes(orjson.dumps(cfg, option=orjson.OPT_INDENT_2))
     except Exception as exc:
         log.warning("Could not save config: %s", exc)
 
@@ -200,14 +338,19 @@ def save_config(cfg: dict) -> None:
 # ---------------------------------------------------------------------------
 # BLE reading
 # ---------------------------------------------------------------------------
+_LOGITECH_RE = re.compile("|".join(re.escape(kw) for kw in DEVICE_KEYWORDS), re.IGNORECASE)
+
+
 def _is_logitech_device(name: str | None) -> bool:
-    if not name:
-        return False
-    return any(kw.lower() in name.lower() for kw in DEVICE_KEYWORDS)
+    return bool(name and _LOGITECH_RE.search(name))
+
 
+async def ble_find_device() -> BLEDevice | None:
+    """Scan for a Logitech BLE device, stopping at the first match.
 
-async def ble_find_device() -> tuple[str, str] | None:
-    """Scan for a Logitech BLE device and return (address, name)."""
+    The returned BLEDevice can be passed straight to BleakClient, which
+    skips a second address lookup when connecting.
+    """
     log.info("BLE scan started (timeout=%.0fs)…", BLE_SCAN_TIMEOUT)
 
     def match(device, _adv):
@@ -216,49 +359,30 @@ async def ble_find_device() -> tuple[str, str] | None:
     device = await BleakScanner.find_device_by_filter(match, timeout=BLE_SCAN_TIMEOUT)
     if device:
         log.info("Found device: %s [%s]", device.name, device.address)
-        return device.address, device.name or "Logitech Mouse"
+        return device
     log.warning("No Logitech BLE device found during scan.")
     return None
 
 
-async def ble_read_battery(address: str) -> int | None:
-    """Connect to device at *address* and read the Battery Level characteristic."""
-    try:
-        async with BleakClient(address, timeout=BLE_CONN_TIMEOUT) as client:
-            # Walk services looking for Battery Service
-            for svc in client.services:
-                if "180f" in svc.uuid.lower():
-                    for char in svc.characteristics:
-                        if "2a19" in char.uuid.lower():
-                            data = await client.read_gatt_char(char.uuid)
-                            level = data[0]
-                            log.info("BLE battery: %d%%", level)
-                            return level
-            log.warning("Battery Service not found on device %s", address)
-    except Exception as exc:
-        log.warning("BLE read failed (%s): %s", address, exc)
+def ble_find_battery_char(client: BleakClient) -> BleakGATTCharacteristic | None:
+    """Walk *client*'s services and return the Battery Level characteristic."""
+    # Bleak normalises UUIDs to lowercase 128-bit form, so plain equality works.
+    for svc in client.services:
+        if svc.uuid == GATT_BATTERY_SERVICE:
+            for char in svc.characteristics:
+                if char.uuid == GATT_BATTERY_CHAR:
+                    return char
     return None
 
 
 # ---------------------------------------------------------------------------
-# Windows Device Information API fallback (PowerShell)
+# Windows Device Information API fallback
 # ---------------------------------------------------------------------------
-_PS_WINDEV = r"""
-Add-Type -AssemblyName System.Runtime.WindowsRuntime
-$null = [Windows.Devices.Enumeration.DeviceInformation,Windows.Devices.Enumeration,ContentType=WindowsRuntime]
-$aqsFilter = 'System.Devices.InterfaceClassGuid:="{0000180F-0000-1000-8000-00805F9B34FB}"'
-$props = [System.Collections.Generic.List[string]]@("System.Devices.BatteryPlusCharging","System.ItemNameDisplay")
-$asyncOp = [Windows.Devices.Enumeration.DeviceInformation]::FindAllAsync($aqsFilter, $props)
-$task    = [System.WindowsRuntimeSystemExtensions]::AsTask($asyncOp)
-$null    = $task.Wait(10000)
-foreach ($dev in $task.Result) {
-    $name  = $dev.Properties["System.ItemNameDisplay"]
-    $level = $dev.Properties["System.Devices.BatteryPlusCharging"]
-    if ($name -and $level -ne $null) {
-        Write-Output "$name|$level"
-    }
-}
-"""
+WINDEV_AQS_FILTER   = 'System.Devices.InterfaceClassGuid:="{0000180F-0000-1000-8000-00805F9B34FB}"'
+WINDEV_BATTERY_PROP = "System.Devices.BatteryPlusCharging"
+WINDEV_TIMEOUT      = 10.0        # seconds for the DeviceInformation query
+
+_DIGITS_RE = re.compile(r"\d+")
 
 _PS_SIMPLE = r"""
 $devices = Get-PnpDevice -Class Bluetooth -Status OK | Where-Object { $_.FriendlyName -match 'MX|Logitech' }
@@ -271,33 +395,83 @@ foreach ($d in $devices) {
 """
 
 
-def windev_read_battery() -> int | None:
-    """Try Windows Device Information API via PowerShell to get battery level."""
-    for script in [_PS_WINDEV, _PS_SIMPLE]:
+def _unbox_int(value) -> int | None:
+    """Best-effort conversion of a boxed WinRT property value to int."""
+    if isinstance(value, int):
+        return value
+    for unbox in (unbox_uint8, unbox_int32, unbox_uint32):
         try:
-            result = subprocess.run(
-                ["powershell", "-NonInteractive", "-WindowStyle", "Hidden", "-Command", script],
-                capture_output=True,
-                text=True,
-                timeout=20,
-                creationflags=subprocess.CREATE_NO_WINDOW,
-            )
-            for line in result.stdout.splitlines():
-                line = line.strip()
-                if "|" in line:
-                    name, level_str = line.rsplit("|", 1)
-                    if _is_logitech_device(name):
-                        m = re.search(r"\d+", level_str)
-                        if m:
-                            level = int(m.group())
-                            if 0 <= level <= 100:
-                                log.info("WinDev battery: %d%% (%s)", level, name)
-                                return level
-        except Exception as exc:
-            log.debug("WinDev script failed: %s", exc)
+            return int(unbox(value))
+        except Exception:
+            continue
+    return None
+
+
+async def _winrt_read_battery() -> int | None:
+    """Query DeviceInformation in-process for a Logitech battery level."""
+    devices = await asyncio.wait_for(
+        DeviceInformation.find_all_async(
+            WINDEV_AQS_FILTER, [WINDEV_BATTERY_PROP],
+        ),
+        WINDEV_TIMEOUT,
+    )
+    for dev in devices:
+        # DeviceInformation.name is System.ItemNameDisplay, so no need to request it
+        if not _is_logitech_device(dev.name):
+            continue
+        props = dev.properties
+        if not props.has_key(WINDEV_BATTERY_PROP):
+            continue
+        level = _unbox_int(props.lookup(WINDEV_BATTERY_PROP))
+        if level is not None and 0 <= level <= 100:
+            log.info("WinDev battery: %d%% (%s)", level, dev.name)
+            return level
+    return None
+
+
+async def _pnp_read_battery() -> int | None:
+    """Read the PnP battery property via PowerShell without blocking the loop."""
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            "powershell", "-NonInteractive", "-WindowStyle", "Hidden", "-Command", _PS_SIMPLE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            creationflags=subprocess.CREATE_NO_WINDOW,
+        )
+        try:
+            stdout, _ = await asyncio.wait_for(proc.communicate(), 20)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise
+        for line in stdout.decode(locale.getpreferredencoding(False), errors="replace").splitlines():
+            line = line.strip()
+            if "|" in line:
+                name, level_str = line.rsplit("|", 1)
+                if _is_logitech_device(name):
+                    m = _DIGITS_RE.search(level_str)
+                    if m:
+                        level = int(m.group())
+                        if 0 <= level <= 100:
+                            log.info("PnP battery: %d%% (%s)", level, name)
+                            return level
+    except Exception as exc:
+        log.debug("PnP script failed: %s", exc)
     return None
 
 
+async def windev_read_battery() -> int | None:
+    """Try the Windows Device Information API, then the PnP property store."""
+    if DeviceInformation is not None:
+        try:
+            level = await _winrt_read_battery()
+            if level is not None:
+                return level
+        except Exception as exc:
+            log.debug("WinRT device query failed: %s", exc)
+    return await _pnp_read_battery()
+
+
 # ---------------------------------------------------------------------------
 # Registry helpers (Start with Windows)
 # ---------------------------------------------------------------------------
@@ -432,18 +606,35 @@ class MouseBatteryMonitor:
         self._device_name: str        = self._cfg.get("device_name", "Logitech Mouse")
         self._address:     str | None = self._cfg.get("address")
         self._alerted:     set[int]   = set()
+        self._last_bucket: int | None = -1      # -1 = no icon assigned yet
+        self._startup_cached: bool | None = None   # lazily read from registry
+
+        # Persistent BLE connection, reopened lazily after any failure
+        self._ble_client:     BleakClient | None = None
+        self._battery_handle: int | None         = None   # resolved for _ble_client
 
         self._loop:   asyncio.AbstractEventLoop | None = None
         self._thread: threading.Thread | None          = None
+        self._wake:   asyncio.Event                    = asyncio.Event()
         self.icon:    pystray.Icon | None              = None
 
+        # Set and consumed on the monitor loop only; see _request_refresh()
+        self._rescan_requested: bool = False
+
     # ------------------------------------------------------------------
     # Icon / tooltip helpers
     # ------------------------------------------------------------------
     def _update_icon(self) -> None:
         if self.icon is None:
             return
-        self.icon.icon = make_icon(self._battery)
+        # Quantise so imperceptible changes don't re-upload the bitmap;
+        # the tooltip below still shows the exact percentage.  Rounding up
+        # keeps the colour bands (all "> multiple of 5") exactly as before
+        # and never shows a nonzero level as "0%".
+        bucket = None if self._battery is None else min(100, -(-self._battery // ICON_STEP) * ICON_STEP)
+        if bucket != self._last_bucket:
+            self.icon.icon = _ICON_CACHE.get(bucket, _ICON_CACHE[None])
+            self._last_bucket = bucket
         if self._battery is None:
             status = "Unknown"
         elif self._battery > 30:
@@ -486,40 +677,118 @@ class MouseBatteryMonitor:
                 )
                 break   # one notification per refresh
 
+    # ------------------------------------------------------------------
+    # BLE connection
+    # ------------------------------------------------------------------
+    async def _ble_read_battery(self, device: BLEDevice | None = None) -> int | None:
+        """Read the Battery Level characteristic from the device at self._address.
+
+        *device*, when given, is the scan result for that address and is
+        used to connect without resolving the address again.
+
+        The connection is kept across refreshes and any failure drops it so
+        the next call reconnects.  An out-of-range level returns None but
+        leaves the client connected, which callers use to tell "no value
+        right now" apart from a failed connection.  The characteristic handle is stable for
+        the lifetime of the bond, so it is persisted in the config and the
+        service walk only runs when it is missing or no longer valid.
+        """
+        client = self._ble_client
+        if client is not None and client.address != self._address:
+            await self._ble_disconnect()
+            client = None
+        try:
+            if client is None or not client.is_connected:
+                await self._ble_disconnect()
+                client = BleakClient(device or self._address, timeout=BLE_CONN_TIMEOUT)
+                await client.connect()
+                self._ble_client = client
+                # A handle can be reused by another characteristic after a
+                # firmware update or re-pair, so check what it points at.
+                handle = self._cfg.get("battery_handle")
+                char = None if handle is None else client.services.get_characteristic(handle)
+                if char is None or char.uuid != GATT_BATTERY_CHAR:
+                    char = ble_find_battery_char(client)
+                    if char is None:
+                        log.warning("Battery Service not found on device %s", self._address)
+                        await self._ble_disconnect()
+                        return None
+                    self._cfg["battery_handle"] = char.handle
+                    save_config(self._cfg)
+                self._battery_handle = char.handle
+            data = await client.read_gatt_char(self._battery_handle)
+            level = data[0]
+            if not 0 <= level <= 100:      # e.g. 0xFF for "unknown"; stay connected
+                log.warning("BLE battery out of range: %d", level)
+                return None
+            log.info("BLE battery: %d%%", level)
+            return level
+        except Exception as exc:
+            log.warning("BLE read failed (%s): %s", self._address, exc)
+            await self._ble_disconnect()
+        return None
+
+    async def _ble_disconnect(self) -> None:
+        client, self._ble_client = self._ble_client, None
+        self._battery_handle = None
+        if client is not None:
+            try:
+                await client.disconnect()
+            except Exception as exc:
+                log.debug("BLE disconnect failed: %s", exc)
+
     # ------------------------------------------------------------------
     # Battery reading pipeline
     # ------------------------------------------------------------------
     async def _read_battery_async(self) -> int | None:
         # 1. Try BLE with cached address
         if self._address:
-            lvl = await ble_read_battery(self._address)
+            lvl = await self._ble_read_battery()
             if lvl is not None:
                 return lvl
+            if self._ble_client is not None:
+                # Still connected: the read worked but the device reported no
+                # usable level (e.g. 0xFF).  Keep the address and try later.
+                return None
             log.info("Cached address failed; will rescan.")
             self._address = None
 
-        # 2. BLE scan
-        result = await ble_find_device()
-        if result:
-            self._address, self._device_name = result
+        # 2. BLE scan — drop any connection first; a connected peripheral
+        #    usually stops advertising and would not be found.
+        await self._ble_disconnect()
+        device = await ble_find_device()
+        if device:
+            self._address     = device.address
+            self._device_name = device.name or "Logitech Mouse"
             self._cfg["address"]     = self._address
             self._cfg["device_name"] = self._device_name
+            self._cfg.pop("battery_handle", None)
             save_config(self._cfg)
-            lvl = await ble_read_battery(self._address)
+            lvl = await self._ble_read_battery(device)
             if lvl is not None:
                 return lvl
 
         # 3. Windows Device API fallback
         log.info("Trying Windows Device API fallback…")
-        lvl = await asyncio.get_event_loop().run_in_executor(None, windev_read_battery)
-        return lvl
+        return await windev_read_battery()
 
     # ------------------------------------------------------------------
     # Refresh
     # ------------------------------------------------------------------
+    async def _forget_device(self) -> None:
+        """Drop the saved device so the next read starts with a fresh scan."""
+        self._address = None
+        self._cfg.pop("address", None)
+        self._cfg.pop("battery_handle", None)
+        save_config(self._cfg)
+        await self._ble_disconnect()
+
     async def _refresh(self) -> None:
         log.info("Refreshing battery level…")
         try:
+            if self._rescan_requested:
+                self._rescan_requested = False
+                await self._forget_device()
             level = await self._read_battery_async()
             self._battery = level
             if level is not None:
@@ -536,32 +805,51 @@ class MouseBatteryMonitor:
         asyncio.set_event_loop(self._loop)
 
         async def _periodic():
+            # All refreshes run here, one at a time; menu callbacks only
+            # wake this loop early instead of scheduling their own refresh.
             while True:
                 await self._refresh()
-                await asyncio.sleep(CHECK_INTERVAL)
+                try:
+                    await asyncio.wait_for(self._wake.wait(), CHECK_INTERVAL)
+                except asyncio.TimeoutError:
+                    pass
+                self._wake.clear()
 
         self._loop.run_until_complete(_periodic())
 
+    def _request_refresh(self, rescan: bool = False) -> None:
+        """Wake the monitor loop from another thread for an immediate refresh.
+
+        With *rescan*, the saved device is forgotten on the loop thread at
+        the start of that refresh, so no state is touched mid-refresh.
+        """
+        if self._loop:
+            self._loop.call_soon_threadsafe(self._wake_up, rescan)
+
+    def _wake_up(self, rescan: bool) -> None:
+        if rescan:
+            self._rescan_requested = True
+        self._wake.set()
+
     # ------------------------------------------------------------------
     # Menu callbacks
     # ------------------------------------------------------------------
     def _on_refresh(self, icon, item) -> None:  # noqa: ARG002
-        if self._loop:
-            asyncio.run_coroutine_threadsafe(self._refresh(), self._loop)
+        self._request_refresh()
 
     def _on_rescan(self, icon, item) -> None:  # noqa: ARG002
-        self._address = None
-        self._cfg.pop("address", None)
-        save_config(self._cfg)
-        if self._loop:
-            asyncio.run_coroutine_threadsafe(self._refresh(), self._loop)
+        self._request_refresh(rescan=True)
 
     def _on_toggle_startup(self, icon, item) -> None:  # noqa: ARG002
-        current = _get_startup_entry() is not None
-        _set_startup_entry(not current)
+        enable = not self._startup_checked(item)
+        _set_startup_entry(enable)
+        self._startup_cached = enable
 
     def _startup_checked(self, item) -> bool:  # noqa: ARG002
-        return _get_startup_entry() is not None
+        # Called on every menu render; only hit the registry once.
+        if self._startup_cached is None:
+            self._startup_cached = _get_startup_entry() is not None
+        return self._startup_cached
 
     def _on_exit(self, icon, item) -> None:  # noqa: ARG002
         if self._loop:
@@ -572,6 +860,8 @@ class MouseBatteryMonitor:
     # Entry point
     # ------------------------------------------------------------------
     def run(self) -> None:
+        _prerender_icons()
+
         # Start background thread
         self._thread = threading.Thread(target=self._monitor_loop, daemon=True)
         self._thread.start()
@@ -592,7 +882,7 @@ class MouseBatteryMonitor:
 
         self.icon = pystray.Icon(
             APP_NAME,
-            make_icon(None),
+            _ICON_CACHE[None],
             APP_NAME,
             menu,
         )
@@ -601,32 +891,10 @@ class MouseBatteryMonitor:
         self.icon.run()
 
 
-# ---------------------------------------------------------------------------
-# Single-instance guard
-# ---------------------------------------------------------------------------
-_MUTEX_HANDLE = None   # keep reference so the handle stays open
-
-
-def _acquire_single_instance() -> bool:
-    """Create a named Windows mutex.  Returns False if another instance owns it."""
-    global _MUTEX_HANDLE
-    ERROR_ALREADY_EXISTS = 183
-    handle = ctypes.windll.kernel32.CreateMutexW(None, True, "LogitechBatteryMonitor_SingleInstance")
-    if ctypes.windll.kernel32.GetLastError() == ERROR_ALREADY_EXISTS:
-        if handle:
-            ctypes.windll.kernel32.CloseHandle(handle)
-        return False
-    _MUTEX_HANDLE = handle   # keep alive for the lifetime of the process
-    return True
-
-
 # ---------------------------------------------------------------------------
 # Entry
 # ---------------------------------------------------------------------------
 if __name__ == "__main__":
-    if not _acquire_single_instance():
-        # Another instance is already running — bail out silently.
-        sys.exit(0)
     log.info("Starting %s", APP_NAME)
     app = MouseBatteryMonitor()
     app.run()